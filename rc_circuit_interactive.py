@@ -1,7 +1,39 @@
+import itertools
+from math import exp
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, RadioButtons, Button
 from matplotlib.animation import FuncAnimation
+from matplotlib.backend_bases import ResizeEvent
+
+from rc_circuit_simulation import charging_v, discharging_v, charging_i, discharging_i, decay
+
+class _GatedTimer:
+    """
+    Canvas timer whose start() only takes effect while the animation is running.
+    
+    FuncAnimation restarts its timer by itself after a window resize; routing
+    it through this wrapper keeps a paused animation paused.
+    """
+    def __init__(self, timer, is_running):
+        self._timer = timer
+        self._is_running = is_running
+    
+    def start(self):
+        if self._is_running():
+            self._timer.start()
+    
+    @property
+    def interval(self):
+        return self._timer.interval
+    
+    @interval.setter
+    def interval(self, value):
+        self._timer.interval = value
+    
+    def __getattr__(self, name):
+        return getattr(self._timer, name)
 
 class InteractiveRCCircuit:
     def __init__(self):
@@ -18,11 +50,39 @@ class InteractiveRCCircuit:
         self.sim_time = self.tau * 5  # Show 5 time constants by default
         self.num_points = 1000
         
+        # Normalized time axis, scaled by sim_time whenever it changes.
+        # float32 is plenty for plotting and halves the waveform memory traffic.
+        self._t_norm = np.linspace(0.0, 1.0, self.num_points, dtype=np.float32)
+        self._t_norm_ms = self._t_norm * 1000
+        
         # Animation parameters
         self.animation = None
         self.anim_speed = 1.0  # Animation speed factor
         self.anim_running = False
         self.t_current = 0
+        self.frame = 0
+        self._next_frame = 0
+        
+        # Set when a parameter, the mode, the run state or the time shown changes
+        self._circuit_dirty = True
+        
+        # Cached waveforms for the running animation, refilled in place by start_animation
+        self._t_values = np.empty_like(self._t_norm)
+        self._t_ms = np.empty_like(self._t_norm)
+        self._v = np.empty_like(self._t_norm)
+        self._i_ma = np.empty_like(self._t_norm)
+        self._cache_valid = False
+        
+        # Running exp(-t/tau) for the animation, advanced by one multiply per frame
+        self._e_cur = 1.0
+        self._decay_step = 1.0
+        self._anim_voltage = self.voltage
+        self._anim_current_ma = self.voltage / self.resistance * 1000
+        
+        # One-point buffers for the time markers, shared x for both plots
+        self._marker_x = np.empty(1)
+        self._marker_yv = np.empty(1)
+        self._marker_yi = np.empty(1)
         
         # Setup the figure and plot
         self.setup_figure()
@@ -52,6 +112,7 @@ class InteractiveRCCircuit:
         self.current_ax.grid(True)
         
         # Draw the circuit diagram
+        self._draw_static_circuit()
         self.draw_circuit_diagram()
         
         # Create the control widgets
@@ -63,15 +124,26 @@ class InteractiveRCCircuit:
         self.time_marker_voltage, = self.voltage_ax.plot([], [], 'ko', markersize=6)
         self.time_marker_current, = self.current_ax.plot([], [], 'ko', markersize=6)
         
+        # Reference line, tau markers and info text, updated in place by _set_axes_limits
+        self.v_ref_line = self.voltage_ax.axhline(y=self.voltage, color='g', 
+                                                  linestyle='--', alpha=0.7)
+        self.tau_marker_v, = self.voltage_ax.plot([], [], 'ro', markersize=6)
+        self.tau_marker_i, = self.current_ax.plot([], [], 'ro', markersize=6)
+        self.tau_text = self.voltage_ax.annotate(
+            '', xy=(0, 0), xytext=(0, 0),
+            arrowprops=dict(facecolor='black', shrink=0.05, width=1)
+        )
+        self.info_text = self.fig.text(0.85, 0.3, '', fontsize=10,
+                                       bbox=dict(facecolor='white', alpha=0.8))
+        
         # Set initial plot limits
         self.update_plot_limits()
         
         # Adjust layout
         plt.tight_layout()
     
-    def draw_circuit_diagram(self):
-        """Draw the RC circuit diagram"""
-        self.circuit_ax.clear()
+    def _draw_static_circuit(self):
+        """Draw the parts of the circuit diagram that never change"""
         self.circuit_ax.set_xlim(0, 10)
         self.circuit_ax.set_ylim(0, 10)
         self.circuit_ax.axis('off')
@@ -81,7 +153,6 @@ class InteractiveRCCircuit:
         # Battery
         self.circuit_ax.add_patch(plt.Rectangle((1, 4), 0.5, 2, fill=False, lw=2))
         self.circuit_ax.plot([0.7, 1.8], [5, 5], 'k-', lw=2)
-        self.circuit_ax.text(1.25, 3.5, f"{self.voltage}V", ha='center')
         
         # Wires
         self.circuit_ax.plot([1.5, 1.5], [6, 8], 'k-', lw=2)  # Vertical wire from battery
@@ -93,7 +164,6 @@ class InteractiveRCCircuit:
         x = np.linspace(4, 6, 9)
         y = 8 + 0.5 * np.array([0, 1, -1, 1, -1, 1, -1, 1, 0])
         self.circuit_ax.plot(x, y, 'k-', lw=2)
-        self.circuit_ax.text(5, 9, f"{self.resistance}Ω", ha='center')
         
         # Wire from resistor to capacitor
         self.circuit_ax.plot([6, 8], [8, 8], 'k-', lw=2)
@@ -101,41 +171,71 @@ class InteractiveRCCircuit:
         # Capacitor
         self.circuit_ax.plot([8, 8], [7, 9], 'k-', lw=2)  # Left plate
         self.circuit_ax.plot([8.5, 8.5], [7, 9], 'k-', lw=2)  # Right plate
-        self.circuit_ax.text(8.25, 6.5, f"{self.capacitance*1e6}μF", ha='center')
         
         # Complete the circuit
         self.circuit_ax.plot([8.5, 8.5], [2, 7], 'k-', lw=2)  # Vertical wire from capacitor
         
-        # Add switch
+        # Capacitor voltage readout, updated in place during the animation
+        self.vcap_text = self.circuit_ax.text(8.25, 10, "", ha='center',
+                                              bbox=dict(facecolor='white', alpha=0.7))
+        
+        # Component values
+        self._v_text = self.circuit_ax.text(1.25, 3.5, "", ha='center')
+        self._r_text = self.circuit_ax.text(5, 9, "", ha='center')
+        self._c_text = self.circuit_ax.text(8.25, 6.5, "", ha='center')
+        
+        # Switch, reshaped in place when the mode changes
+        self._switch_line, = self.circuit_ax.plot([], [], 'k-', lw=2)
+        
+        # Current flow indicators (arrows), shown only while animating
+        self._charge_arrows = (
+            # Arrow along the top wire
+            self.circuit_ax.arrow(3, 8, 0.5, 0, head_width=0.2, head_length=0.3, fc='blue', ec='blue'),
+            # Arrow along the right vertical wire (capacitor)
+            self.circuit_ax.arrow(8.5, 5, 0, -0.5, head_width=0.2, head_length=0.3, fc='blue', ec='blue'),
+        )
+        # Arrow for discharge current (flowing in the opposite direction)
+        self._discharge_arrow = self.circuit_ax.arrow(
+            3, 2, 0.5, 0, head_width=0.2, head_length=0.3, fc='red', ec='red')
+    
+    def draw_circuit_diagram(self):
+        """Update the state-dependent parts of the RC circuit diagram"""
+        if not self._circuit_dirty:
+            return
+        
+        # Component values
+        self._v_text.set_text(f"{self.voltage}V")
+        self._r_text.set_text(f"{self.resistance}Ω")
+        self._c_text.set_text(f"{self.capacitance*1e6}μF")
+        
+        # Switch
         switch_x = 3
         switch_y = 2
         if self.mode == 'charging':
             # Closed switch
-            self.circuit_ax.plot([switch_x-1, switch_x+1], [switch_y, switch_y], 'k-', lw=2)
+            self._switch_line.set_data([switch_x-1, switch_x+1], [switch_y, switch_y])
         else:
             # Open switch
-            self.circuit_ax.plot([switch_x-1, switch_x], [switch_y, switch_y], 'k-', lw=2)
-            self.circuit_ax.plot([switch_x, switch_x+0.7], [switch_y, switch_y+0.7], 'k-', lw=2)
-        
-        # Draw current flow indicators (arrows) if in charging mode
-        if self.mode == 'charging' and self.anim_running:
-            # Add arrow along the top wire
-            self.circuit_ax.arrow(3, 8, 0.5, 0, head_width=0.2, head_length=0.3, fc='blue', ec='blue')
-            # Add arrow along the right vertical wire (capacitor)
-            self.circuit_ax.arrow(8.5, 5, 0, -0.5, head_width=0.2, head_length=0.3, fc='blue', ec='blue')
-        elif self.mode == 'discharging' and self.anim_running:
-            # Add arrow for discharge current (flowing in the opposite direction)
-            self.circuit_ax.arrow(3, 2, 0.5, 0, head_width=0.2, head_length=0.3, fc='red', ec='red')
+            self._switch_line.set_data([switch_x-1, switch_x, switch_x+0.7],
+                                       [switch_y, switch_y, switch_y+0.7])
+        
+        # Current flow indicators
+        for arrow in self._charge_arrows:
+            arrow.set_visible(self.mode == 'charging' and self.anim_running)
+        self._discharge_arrow.set_visible(self.mode == 'discharging' and self.anim_running)
         
         # Update the circuit diagram with the current capacitor voltage
-        if hasattr(self, 't_current'):
+        if self._cache_valid:
+            v_cap = self._v[min(self.frame, len(self._v) - 1)]
+        else:
             if self.mode == 'charging':
                 v_cap = self.charging_voltage(self.t_current)
             else:
                 v_cap = self.discharging_voltage(self.t_current)
-            
-            self.circuit_ax.text(8.25, 10, f"Vcap = {v_cap:.2f}V", ha='center', 
-                                bbox=dict(facecolor='white', alpha=0.7))
+        
+        self.vcap_text.set_text(f"Vcap = {v_cap:.2f}V")
+        
+        self._circuit_dirty = False
     
     def create_widgets(self):
         """Create the interactive widgets (sliders, buttons, etc)"""
@@ -177,6 +277,15 @@ class InteractiveRCCircuit:
         self.start_button = Button(start_ax, 'Start/Pause')
         self.reset_button = Button(reset_ax, 'Reset')
         
+        # Parameters of the last slider update, to skip repeated events
+        self._last_params = (self.resistance_slider.val, self.capacitance_slider.val,
+                             self.voltage_slider.val, self.mode)
+        
+        # Coalesce bursts of slider events into a single update
+        self._debounce_timer = self.fig.canvas.new_timer(interval=50)
+        self._debounce_timer.single_shot = True
+        self._debounce_timer.add_callback(self._apply_params)
+        
         # Connect events
         self.resistance_slider.on_changed(self.update_params)
         self.capacitance_slider.on_changed(self.update_params)
@@ -187,10 +296,23 @@ class InteractiveRCCircuit:
     
     def update_params(self, val):
         """Update the circuit parameters when sliders change"""
+        # Sliders can report the same value again, nothing to do then
+        key = (self.resistance_slider.val, self.capacitance_slider.val,
+               self.voltage_slider.val, self.mode)
+        if key == self._last_params:
+            return
+        self._last_params = key
+        
         self.resistance = self.resistance_slider.val
         self.capacitance = self.capacitance_slider.val * 1e-6  # Convert μF to F
         self.voltage = self.voltage_slider.val
         
+        # Defer the recompute until the slider has settled
+        self._debounce_timer.stop()
+        self._debounce_timer.start()
+    
+    def _apply_params(self):
+        """Recompute the simulation for the latest slider values"""
         # Recalculate time constant
         self.tau = self.resistance * self.capacitance
         
@@ -199,37 +321,47 @@ class InteractiveRCCircuit:
         if self.mode == 'both':
             self.sim_time = self.tau * 10
         
-        # Update the plot limits
-        self.update_plot_limits()
+        # Cached waveforms and the component values in the diagram are stale now
+        self._cache_valid = False
+        self._circuit_dirty = True
         
         # Redraw the circuit diagram
         self.draw_circuit_diagram()
         
-        # Restart animation if it was running
+        # Refresh the running animation, it recomputes the waveforms itself
         if self.anim_running and self.animation is not None:
-            self.animation.event_source.stop()
+            self._set_axes_limits()
             self.start_animation()
+        else:
+            self.update_plot_limits()
+        
+        self.fig.canvas.draw_idle()
     
     def update_mode(self, label):
         """Update the circuit mode when radio buttons change"""
-        if label == 'Charging':
-            self.mode = 'charging'
-        else:
-            self.mode = 'discharging'
+        mode = 'charging' if label == 'Charging' else 'discharging'
+        if mode != self.mode:
+            self.mode = mode
+            self._circuit_dirty = True
         
         # Reset time to zero
+        if self.t_current != 0:
+            self._circuit_dirty = True
         self.t_current = 0
+        self.frame = 0
         
-        # Update the plot limits
-        self.update_plot_limits()
+        # Cached waveforms are stale now
+        self._cache_valid = False
         
         # Redraw the circuit diagram
         self.draw_circuit_diagram()
         
-        # Restart animation if it was running
+        # Refresh the running animation, it recomputes the waveforms itself
         if self.anim_running and self.animation is not None:
-            self.animation.event_source.stop()
+            self._set_axes_limits()
             self.start_animation()
+        else:
+            self.update_plot_limits()
     
     def toggle_animation(self, event):
         """Start or pause the animation"""
@@ -237,20 +369,28 @@ class InteractiveRCCircuit:
             # Pause the animation
             self.anim_running = False
             if self.animation is not None:
-                self.animation.event_source.stop()
+                self._stop_animation()
         else:
             # Start the animation
             self.anim_running = True
             self.start_animation()
+        
+        # Show or hide the current flow arrows
+        self._circuit_dirty = True
+        self.draw_circuit_diagram()
+        self.fig.canvas.draw_idle()
     
     def reset(self, event):
         """Reset the simulation to initial state"""
-        # Reset time to zero
+        # Reset time to zero, the run state and the time shown may change
+        if self.t_current != 0 or self.anim_running:
+            self._circuit_dirty = True
         self.t_current = 0
+        self.frame = 0
         
         # Stop animation if running
         if self.animation is not None:
-            self.animation.event_source.stop()
+            self._stop_animation()
             self.anim_running = False
         
         # Update plots with the initial state
@@ -258,45 +398,96 @@ class InteractiveRCCircuit:
         
         # Redraw the circuit diagram
         self.draw_circuit_diagram()
+        self.fig.canvas.draw_idle()
+    
+    def _stop_animation(self):
+        """Stop the animation timer and hand the blitted artists back to normal draws"""
+        self.animation.event_source.stop()
+        for artist in (self.time_marker_voltage, self.time_marker_current, self.vcap_text):
+            artist.set_animated(False)
+    
+    def _restart_animation(self):
+        """Restart the running animation on a freshly drawn background"""
+        # FuncAnimation only re-grabs its blit backgrounds when the view limits
+        # change or the canvas is resized. Its resize handling stops the timer,
+        # drops the stale backgrounds, re-runs init_func and restarts the timer
+        # (through _GatedTimer) once the redraw is done, which is exactly a
+        # restart, so reuse it rather than poking at its internals.
+        self.fig.canvas.callbacks.process('resize_event',
+                                          ResizeEvent('resize_event', self.fig.canvas))
     
     def start_animation(self):
         """Start the animation"""
-        # Set up time array for animation
+        # Refill the cached time axis and waveforms in place
         t_max = self.sim_time
-        t_values = np.linspace(0, t_max, self.num_points)
-        
-        # Initialize data
-        if self.mode == 'charging':
-            v_values = self.charging_voltage(t_values)
-            i_values = self.charging_current(t_values)
-        else:  # discharging
-            v_values = self.discharging_voltage(t_values)
-            i_values = self.discharging_current(t_values)
+        np.multiply(self._t_norm, t_max, out=self._t_values)
+        np.multiply(self._t_norm_ms, t_max, out=self._t_ms)  # Time axis in ms
+        self._fill_waveforms(self._t_values, self._v, self._i_ma)
+        np.multiply(self._i_ma, 1000, out=self._i_ma)  # Convert to mA
+        self._cache_valid = True
+        self._next_frame = 0
+        
+        # Per-frame decay factor for the equally spaced animation frames, and
+        # the amplitudes it scales. They are snapshotted with the curves, since
+        # the sliders update the live parameters before the debounced recompute.
+        self._decay_step = exp(-t_max / (self.num_points - 1) / self.tau)
+        self._e_cur = 1.0
+        self._anim_voltage = self.voltage
+        self._anim_current_ma = self.voltage / self.resistance * 1000
         
         # Set data for plots
-        self.voltage_line.set_data(t_values * 1000, v_values)  # Convert to ms
-        self.current_line.set_data(t_values * 1000, i_values * 1000)  # Convert to ms and mA
-        
-        # Create the animation
-        self.animation = FuncAnimation(
-            self.fig, self.animate_func, frames=self.num_points,
-            interval=50 / self.anim_speed, blit=False, repeat=False
-        )
+        self.voltage_line.set_data(self._t_ms, self._v)
+        self.current_line.set_data(self._t_ms, self._i_ma)
+        
+        # The animation is created once and kept alive, later starts only
+        # swap its data and restart its timer
+        if self.animation is None:
+            interval = 50 / self.anim_speed
+            timer = _GatedTimer(self.fig.canvas.new_timer(interval=interval),
+                                lambda: self.anim_running)
+            self.animation = FuncAnimation(
+                self.fig, self.animate_func, frames=itertools.count(),
+                init_func=self._init_animation, event_source=timer,
+                interval=interval, blit=True, cache_frame_data=False
+            )
+        else:
+            self._restart_animation()
+    
+    def _init_animation(self):
+        """Artists FuncAnimation blits after a (re)draw, none while paused"""
+        if not self.anim_running:
+            return ()
+        return self.time_marker_voltage, self.time_marker_current, self.vcap_text
     
-    def animate_func(self, frame):
+    def animate_func(self, tick):
         """Animation function that updates the time marker"""
-        # Calculate the current time based on the frame
-        t_max = self.sim_time
-        t = frame * t_max / self.num_points
-        self.t_current = t
+        # Advance to the next frame, looping at the end
+        frame = self._next_frame
+        self._next_frame = (frame + 1) % self.num_points
+        self.frame = frame
+        t_ms = self._t_ms[frame]
+        self.t_current = t_ms / 1000
+        
+        # exp(-t/tau) one step further along: E_k = E_(k-1) * exp(-dt/tau)
+        if frame == 0:
+            self._e_cur = 1.0
+        else:
+            self._e_cur *= self._decay_step
+        if self.mode == 'charging':
+            v = self._anim_voltage * (1 - self._e_cur)
+            i_ma = self._anim_current_ma * self._e_cur
+        else:  # discharging
+            v = self._anim_voltage * self._e_cur
+            i_ma = -self._anim_current_ma * self._e_cur
         
-        # Update the plot
-        self.update_plot(t)
+        # Update time markers
+        self._set_markers(t_ms, v, i_ma)
         
-        # Redraw the circuit diagram to update the voltage display
-        self.draw_circuit_diagram()
+        # Update the voltage display
+        self.vcap_text.set_text(f"Vcap = {v:.2f}V")
         
-        return self.voltage_line, self.current_line, self.time_marker_voltage, self.time_marker_current
+        # Only the markers and the readout change, so only they are blitted
+        return self.time_marker_voltage, self.time_marker_current, self.vcap_text
     
     def update_plot(self, t):
         """Update the plot markers for the current time"""
@@ -309,51 +500,43 @@ class InteractiveRCCircuit:
             i = self.discharging_current(t)
         
         # Update time markers
-        self.time_marker_voltage.set_data([t * 1000], [v])
-        self.time_marker_current.set_data([t * 1000], [i * 1000])  # Convert to mA
+        self._set_markers(t * 1000, v, i * 1000)  # Convert to ms and mA
+    
+    def _set_markers(self, t_ms, v, i_ma):
+        """Move both time markers, reusing the preallocated point buffers"""
+        self._marker_x[0] = t_ms
+        self._marker_yv[0] = v
+        self._marker_yi[0] = i_ma
+        self.time_marker_voltage.set_data(self._marker_x, self._marker_yv)
+        self.time_marker_current.set_data(self._marker_x, self._marker_yi)
     
     def update_plot_limits(self):
-        """Update the axis limits for the plots"""
-        # Calculate time array
+        """Update the axis limits and the static waveforms for the plots"""
+        self._set_axes_limits()
+        self._recompute_waveforms()
+    
+    def _set_axes_limits(self):
+        """Update the axis limits, tau markers and info text for the plots"""
         t_max = self.sim_time
-        t_values = np.linspace(0, t_max, self.num_points)
-        
-        # Calculate voltage and current values
-        if self.mode == 'charging':
-            v_values = self.charging_voltage(t_values)
-            i_values = self.charging_current(t_values)
-        else:  # discharging
-            v_values = self.discharging_voltage(t_values)
-            i_values = self.discharging_current(t_values)
         
         # Set limits for voltage plot
         self.voltage_ax.set_xlim(0, t_max * 1000)  # Convert to ms
         max_voltage = self.voltage * 1.1  # Add 10% margin
         self.voltage_ax.set_ylim(-0.1, max_voltage)
         
-        # Add reference line for source voltage
-        if hasattr(self, 'v_ref_line'):
-            self.v_ref_line.remove()
-        self.v_ref_line = self.voltage_ax.axhline(y=self.voltage, color='g', 
-                                         linestyle='--', alpha=0.7)
+        # Move the reference line for source voltage
+        self.v_ref_line.set_ydata([self.voltage, self.voltage])
         
         # Set limits for current plot
         self.current_ax.set_xlim(0, t_max * 1000)  # Convert to ms
-        max_current = np.max(np.abs(i_values)) * 1000 * 1.1  # Convert to mA and add margin
+        max_current = self.voltage / self.resistance * 1000 * 1.1  # Peak current at t=0, in mA with margin
         self.current_ax.set_ylim(-max_current, max_current)
         
         # Mark the time constant on the plots
         tau_ms = self.tau * 1000
+        show_tau = tau_ms < t_max * 1000
         
-        # Clear any existing tau markers
-        if hasattr(self, 'tau_markers'):
-            for marker in self.tau_markers:
-                if marker:
-                    marker.remove()
-        
-        self.tau_markers = []
-        
-        if tau_ms < t_max * 1000:
+        if show_tau:
             if self.mode == 'charging':
                 v_tau = self.voltage * (1 - np.exp(-1))  # ~63.2% of full voltage
                 i_tau = self.charging_current(self.tau) * 1000  # in mA
@@ -361,26 +544,17 @@ class InteractiveRCCircuit:
                 v_tau = self.voltage * np.exp(-1)  # ~36.8% of initial voltage
                 i_tau = self.discharging_current(self.tau) * 1000  # in mA
             
-            # Add tau marker to voltage plot
-            tau_marker_v = self.voltage_ax.plot(tau_ms, v_tau, 'ro', markersize=6)[0]
-            self.tau_markers.append(tau_marker_v)
-            
-            # Add tau marker to current plot
-            tau_marker_i = self.current_ax.plot(tau_ms, i_tau, 'ro', markersize=6)[0]
-            self.tau_markers.append(tau_marker_i)
-            
-            # Add annotation for tau
-            tau_text = self.voltage_ax.annotate(
-                f'τ = {tau_ms:.2f} ms', xy=(tau_ms, v_tau),
-                xytext=(tau_ms + 5, v_tau + 0.2),
-                arrowprops=dict(facecolor='black', shrink=0.05, width=1)
-            )
-            self.tau_markers.append(tau_text)
+            # Move the tau markers and annotation
+            self.tau_marker_v.set_data([tau_ms], [v_tau])
+            self.tau_marker_i.set_data([tau_ms], [i_tau])
+            self.tau_text.set_text(f'τ = {tau_ms:.2f} ms')
+            self.tau_text.xy = (tau_ms, v_tau)
+            self.tau_text.set_position((tau_ms + 5, v_tau + 0.2))
         
-        # Add circuit information text
-        if hasattr(self, 'info_text'):
-            self.info_text.remove()
+        for artist in (self.tau_marker_v, self.tau_marker_i, self.tau_text):
+            artist.set_visible(show_tau)
         
+        # Update circuit information text
         info_str = (
             f"RC Circuit Parameters:\n"
             f"R = {self.resistance:.0f} Ω\n"
@@ -390,33 +564,62 @@ class InteractiveRCCircuit:
             f"After 1τ: {100 * (1 - np.exp(-1)):.1f}% charged\n"
             f"After 5τ: {100 * (1 - np.exp(-5)):.1f}% charged"
         )
+        self.info_text.set_text(info_str)
+    
+    def _recompute_waveforms(self):
+        """Recompute and draw the static voltage and current curves"""
+        # Calculate time array
+        t_max = self.sim_time
+        t_values = self._t_norm * t_max
+        t_ms = self._t_norm_ms * t_max
         
-        self.info_text = self.fig.text(0.85, 0.3, info_str, fontsize=10,
-                              bbox=dict(facecolor='white', alpha=0.8))
+        # Calculate voltage and current values
+        v_values, i_values = self._waveforms(t_values)
         
         # Draw the static plot
+        self.voltage_line.set_data(t_ms, v_values)
+        self.current_line.set_data(t_ms, i_values * 1000)  # Convert to mA
+    
+    def _waveforms(self, t_values):
+        """Voltage and current arrays for the current mode, sharing one exponential"""
+        v_values = np.empty_like(t_values)
+        i_values = np.empty_like(t_values)
+        self._fill_waveforms(t_values, v_values, i_values)
+        return v_values, i_values
+    
+    def _fill_waveforms(self, t_values, v_out, i_out):
+        """Write the voltage and current for the current mode into preallocated arrays"""
+        decay(t_values, self.tau, out=v_out)
         if self.mode == 'charging':
-            self.voltage_line.set_data(t_values * 1000, v_values)
-            self.current_line.set_data(t_values * 1000, i_values * 1000)  # Convert to mA
+            np.multiply(v_out, self.voltage / self.resistance, out=i_out)
+            np.subtract(1.0, v_out, out=v_out)
         else:  # discharging
-            self.voltage_line.set_data(t_values * 1000, v_values)
-            self.current_line.set_data(t_values * 1000, i_values * 1000)  # Convert to mA
+            np.multiply(v_out, -self.voltage / self.resistance, out=i_out)
+        np.multiply(v_out, self.voltage, out=v_out)
     
     def charging_voltage(self, t):
         """Calculate capacitor voltage during charging at time t"""
-        return self.voltage * (1 - np.exp(-t / self.tau))
+        if np.isscalar(t):
+            return self.voltage * (1 - exp(-t / self.tau))
+        return charging_v(t, self.voltage, self.tau)
     
     def discharging_voltage(self, t):
         """Calculate capacitor voltage during discharging at time t"""
-        return self.voltage * np.exp(-t / self.tau)
+        if np.isscalar(t):
+            return self.voltage * exp(-t / self.tau)
+        return discharging_v(t, self.voltage, self.tau)
     
     def charging_current(self, t):
         """Calculate current during charging at time t"""
-        return (self.voltage / self.resistance) * np.exp(-t / self.tau)
+        if np.isscalar(t):
+            return (self.voltage / self.resistance) * exp(-t / self.tau)
+        return charging_i(t, self.voltage, self.resistance, self.tau)
     
     def discharging_current(self, t):
         """Calculate current during discharging at time t"""
-        return -(self.voltage / self.resistance) * np.exp(-t / self.tau)
+        if np.isscalar(t):
+            return -(self.voltage / self.resistance) * exp(-t / self.tau)
+        return discharging_i(t, self.voltage, self.resistance, self.tau)
     
     def show(self):
         """Display the interactive plot"""
@@ -2,6 +2,99 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy.integrate import odeint
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, the kernels then run as plain numpy
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import numexpr as ne
+    _USE_NUMEXPR = True
+except ImportError:  # numexpr is optional, decay then uses np.exp
+    _USE_NUMEXPR = False
+
+# Below this many points numexpr's per-call overhead outweighs its speedup
+_NUMEXPR_MIN_POINTS = 4096
+
+# Above this many points the compiled kernels beat the numpy ufunc chain
+_CYTHON_MIN_POINTS = 4096
+
+# (rc_charge, rc_discharge) once loaded, False if they are unavailable
+_cython_kernels = None
+
+def _load_cython_kernels():
+    """Build and import rc_kernels.pyx on first use, caching the outcome"""
+    global _cython_kernels
+    if _cython_kernels is None:
+        try:
+            # pyximport compiles rc_kernels.pyx and reuses the cached build
+            # until the source changes
+            import pyximport
+            importers = pyximport.install(language_level=3)
+            try:
+                from rc_kernels import rc_charge, rc_discharge
+            finally:
+                pyximport.uninstall(*importers)
+            _cython_kernels = (rc_charge, rc_discharge)
+        except ImportError:  # Cython is optional, simulate then stays on numpy
+            _cython_kernels = False
+    return _cython_kernels
+
+def decay(t_values, tau, out=None):
+    """Evaluate exp(-t/tau) over an array of times, optionally into out"""
+    if _USE_NUMEXPR and len(t_values) >= _NUMEXPR_MIN_POINTS:
+        return ne.evaluate("exp(-t / tau)", local_dict={'t': t_values, 'tau': tau}, out=out)
+    if out is None:
+        return np.exp(-t_values / tau)
+    np.divide(t_values, -tau, out=out)
+    return np.exp(out, out=out)
+
+# Analytical RC kernels, shared with rc_circuit_interactive.
+# They accept scalar or array t.
+@njit(cache=True, fastmath=True)
+def charging_v(t, V, tau):
+    """Capacitor voltage during charging"""
+    return V * (1 - np.exp(-t / tau))
+
+@njit(cache=True, fastmath=True)
+def discharging_v(t, V, tau):
+    """Capacitor voltage during discharging"""
+    return V * np.exp(-t / tau)
+
+@njit(cache=True, fastmath=True)
+def charging_i(t, V, R, tau):
+    """Current during charging"""
+    return (V / R) * np.exp(-t / tau)
+
+@njit(cache=True, fastmath=True)
+def discharging_i(t, V, R, tau):
+    """Current during discharging"""
+    return -(V / R) * np.exp(-t / tau)
+
+# Right-hand side of dv/dt for a capacitor charging through R from a source V.
+# Not JIT-compiled: odeint calls the RHS back through Python on every step,
+# so @njit would only add compile time here.
+def _rc_rhs(v, t, V, R, C):
+    return (V - v) / (R * C)
+
+def simulate_ode(rhs, y0, t_values, args=()):
+    """
+    Numerically integrate a circuit ODE dy/dt = rhs(y, t, *args)
+    
+    Parameters:
+        rhs: Right-hand side function, called as rhs(y, t, *args)
+        y0: Initial state (scalar or array)
+        t_values: Array of time values, starting at the initial time
+        args: Extra arguments passed on to rhs
+    
+    Returns:
+        y_values: Array of states, one row per time value
+    """
+    return odeint(rhs, y0, t_values, args=args)
+
 class RCCircuit:
     def __init__(self, resistance=1000, capacitance=1e-6, voltage=5):
         """
@@ -19,21 +112,21 @@ class RCCircuit:
     
     def charging_voltage(self, t):
         """Calculate capacitor voltage during charging at time t"""
-        return self.V * (1 - np.exp(-t / self.tau))
+        return charging_v(t, self.V, self.tau)
     
     def discharging_voltage(self, t):
         """Calculate capacitor voltage during discharging at time t"""
-        return self.V * np.exp(-t / self.tau)
+        return discharging_v(t, self.V, self.tau)
     
     def charging_current(self, t):
         """Calculate current during charging at time t"""
-        return (self.V / self.R) * np.exp(-t / self.tau)
+        return charging_i(t, self.V, self.R, self.tau)
     
     def discharging_current(self, t):
         """Calculate current during discharging at time t"""
-        return -(self.V / self.R) * np.exp(-t / self.tau)
+        return discharging_i(t, self.V, self.R, self.tau)
     
-    def simulate(self, total_time=0.1, num_points=1000, mode='charging'):
+    def simulate(self, total_time=0.1, num_points=1000, mode='charging', dtype=np.float64):
         """
         Simulate the RC circuit
         
@@ -41,39 +134,88 @@ class RCCircuit:
             total_time: Total simulation time in seconds
             num_points: Number of simulation points
             mode: 'charging', 'discharging', or 'both'
+            dtype: Floating point type of the returned arrays (default: float64)
         
         Returns:
             t_values: Array of time values
             v_values: Array of voltage values
             i_values: Array of current values
         """
-        t_values = np.linspace(0, total_time, num_points)
-        v_values = np.zeros_like(t_values)
-        i_values = np.zeros_like(t_values)
+        t_values = np.linspace(0, total_time, num_points, dtype=dtype)
+        v_values = np.empty_like(t_values)
+        i_values = np.empty_like(t_values)
+        
+        self.simulate_into(t_values, v_values, i_values, mode)
+        
+        return t_values, v_values, i_values
+
+    def simulate_into(self, t_values, v_out, i_out, mode='charging'):
+        """
+        Simulate the RC circuit into preallocated arrays
         
+        Parameters:
+            t_values: Array of time values
+            v_out: Array receiving the voltage values (same shape as t_values)
+            i_out: Array receiving the current values (same shape as t_values)
+            mode: 'charging', 'discharging', or 'both'
+        """
         if mode == 'charging':
-            v_values = self.charging_voltage(t_values)
-            i_values = self.charging_current(t_values)
+            self._fill_phase(t_values, v_out, i_out, charging=True)
         elif mode == 'discharging':
-            v_values = self.discharging_voltage(t_values)
-            i_values = self.discharging_current(t_values)
+            self._fill_phase(t_values, v_out, i_out, charging=False)
         elif mode == 'both':
             # For 'both', we'll split the time in half
             half_point = len(t_values) // 2
-            charging_time = t_values[:half_point]
-            discharging_time = t_values[half_point:] - t_values[half_point]
             
             # Charging phase
-            v_values[:half_point] = self.charging_voltage(charging_time)
-            i_values[:half_point] = self.charging_current(charging_time)
+            self._fill_phase(t_values[:half_point], v_out[:half_point], 
+                             i_out[:half_point], charging=True)
             
             # Discharging phase (starting from the charged voltage)
-            v_values[half_point:] = self.V * np.exp(-discharging_time / self.tau)
-            i_values[half_point:] = -self.V / self.R * np.exp(-discharging_time / self.tau)
+            v_dis = v_out[half_point:]
+            np.subtract(t_values[half_point:], t_values[half_point], out=v_dis)
+            self._fill_phase(v_dis, v_dis, i_out[half_point:], charging=False)
+        else:
+            v_out.fill(0)
+            i_out.fill(0)
+
+    def _fill_phase(self, t_values, v_out, i_out, charging):
+        """Write one charging or discharging phase in place, t_values may alias v_out"""
+        arrays = (t_values, v_out, i_out)
+        if (len(t_values) > _CYTHON_MIN_POINTS and
+                all(a.dtype == np.float64 and a.flags.c_contiguous for a in arrays)):
+            kernels = _load_cython_kernels()
+            if kernels:
+                rc_charge, rc_discharge = kernels
+                kernel = rc_charge if charging else rc_discharge
+                kernel(t_values, self.V, self.tau, self.R, v_out, i_out)
+                return
         
-        return t_values, v_values, i_values
+        decay(t_values, self.tau, out=v_out)
+        if charging:
+            np.multiply(v_out, self.V / self.R, out=i_out)
+            np.subtract(1.0, v_out, out=v_out)
+        else:
+            np.multiply(v_out, -self.V / self.R, out=i_out)
+        np.multiply(v_out, self.V, out=v_out)
+
+    def simulate_numeric(self, t_values):
+        """
+        Simulate RC charging by numerically integrating the circuit ODE
+        
+        Parameters:
+            t_values: Array of time values, starting at the initial time
+        
+        Returns:
+            v_values: Array of voltage values
+            i_values: Array of current values
+        """
+        v_values = simulate_ode(_rc_rhs, 0.0, t_values, args=(self.V, self.R, self.C))[:, 0]
+        i_values = (self.V - v_values) / self.R
+        
+        return v_values, i_values
 
-    def plot_simulation(self, total_time=0.1, num_points=1000, mode='charging'):
+    def plot_simulation(self, total_time=0.1, num_points=1000, mode='charging', fig=None):
         """
         Plot the voltage and current curves for the RC circuit
         
@@ -81,16 +223,50 @@ class RCCircuit:
             total_time: Total simulation time in seconds
             num_points: Number of simulation points
             mode: 'charging', 'discharging', or 'both'
+            fig: Figure returned by an earlier call to update in place (default: new figure)
         """
-        t, v, i = self.simulate(total_time, num_points, mode)
-        
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+        # float32 is plenty for plotting and halves the memory traffic
+        t, v, i = self.simulate(total_time, num_points, mode, dtype=np.float32)
+        t_ms = t * 1000
         
-        # Plot voltage
-        ax1.plot(t * 1000, v, 'b-', linewidth=2)
-        ax1.set_title('RC Circuit Simulation')
-        ax1.set_ylabel('Voltage (V)')
-        ax1.grid(True)
+        new_figure = fig is None
+        if new_figure:
+            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+            
+            # Plot voltage
+            voltage_line, = ax1.plot(t_ms, v, 'b-', linewidth=2)
+            ax1.set_title('RC Circuit Simulation')
+            ax1.set_ylabel('Voltage (V)')
+            ax1.grid(True)
+            
+            # Plot current
+            current_line, = ax2.plot(t_ms, i * 1000, 'r-', linewidth=2)  # Convert to mA
+            ax2.set_xlabel('Time (ms)')
+            ax2.set_ylabel('Current (mA)')
+            ax2.grid(True)
+            
+            plt.tight_layout()
+            
+            # Keep the handles on the figure so later calls can reuse it
+            fig._rc_lines = (voltage_line, current_line)
+            fig._rc_info_text = fig.text(0.02, 0.02, '', fontsize=10, 
+                                         bbox=dict(facecolor='white', alpha=0.8))
+            fig._rc_decorations = []
+        else:
+            ax1, ax2 = fig._rc_lines[0].axes, fig._rc_lines[1].axes
+            
+            # Drop the markers that depend on the previous parameters
+            for artist in fig._rc_decorations:
+                artist.remove()
+            fig._rc_decorations = []
+            
+            # Swap the curve data and rescale to it, before the new markers
+            # are added so they scale the axes exactly as on a new figure
+            fig._rc_lines[0].set_data(t_ms, v)
+            fig._rc_lines[1].set_data(t_ms, i * 1000)  # Convert to mA
+            for ax in (ax1, ax2):
+                ax.relim()
+                ax.autoscale_view()
         
         # Mark time constant
         if mode != 'both':
@@ -101,24 +277,18 @@ class RCCircuit:
                 else:  # discharging
                     v_tau = self.V * np.exp(-1)  # ~36.8% of initial voltage
                 
-                ax1.plot(tau_ms, v_tau, 'ro', markersize=8)
-                ax1.annotate(f'τ = {tau_ms:.2f} ms', 
-                             xy=(tau_ms, v_tau), 
-                             xytext=(tau_ms + 2, v_tau + 0.2),
-                             arrowprops=dict(facecolor='black', shrink=0.05, width=1.5))
-        
-        # Plot current
-        ax2.plot(t * 1000, i * 1000, 'r-', linewidth=2)  # Convert to mA
-        ax2.set_xlabel('Time (ms)')
-        ax2.set_ylabel('Current (mA)')
-        ax2.grid(True)
+                fig._rc_decorations += ax1.plot(tau_ms, v_tau, 'ro', markersize=8)
+                fig._rc_decorations.append(ax1.annotate(
+                    f'τ = {tau_ms:.2f} ms', 
+                    xy=(tau_ms, v_tau), 
+                    xytext=(tau_ms + 2, v_tau + 0.2),
+                    arrowprops=dict(facecolor='black', shrink=0.05, width=1.5)))
         
         # Add horizontal line at V/R for charging or 0 for discharging
         if mode == 'charging':
-            ax1.axhline(y=self.V, color='g', linestyle='--', alpha=0.7)
-            ax1.text(total_time * 500, self.V * 1.02, f'Vs = {self.V} V', color='g')
-        
-        plt.tight_layout()
+            fig._rc_decorations.append(ax1.axhline(y=self.V, color='g', linestyle='--', alpha=0.7))
+            fig._rc_decorations.append(
+                ax1.text(total_time * 500, self.V * 1.02, f'Vs = {self.V} V', color='g'))
         
         # Add circuit information
         info_text = (
@@ -128,11 +298,12 @@ class RCCircuit:
             f"V = {self.V} V\n"
             f"τ = RC = {self.tau * 1000:.2f} ms"
         )
+        fig._rc_info_text.set_text(info_text)
         
-        plt.figtext(0.02, 0.02, info_text, fontsize=10, 
-                   bbox=dict(facecolor='white', alpha=0.8))
-        
-        plt.show()
+        if new_figure:
+            plt.show()
+        else:
+            fig.canvas.draw_idle()
         
         return fig
 
@@ -0,0 +1,27 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# Compiled RC kernels for large time axes, loaded through pyximport by rc_circuit_simulation.
+# Each kernel does one exp and a couple of multiplies per point, with no temporary arrays.
+# t may alias vout, every element is read before it is written.
+from libc.math cimport exp
+
+cpdef void rc_charge(double[::1] t, double V, double tau, double R,
+                     double[::1] vout, double[::1] iout) noexcept nogil:
+    """Fill vout/iout with the charging voltage and current at times t"""
+    cdef Py_ssize_t i
+    cdef double e
+    cdef double i0 = V / R
+    for i in range(t.shape[0]):
+        e = exp(-t[i] / tau)
+        vout[i] = V - V * e
+        iout[i] = i0 * e
+
+cpdef void rc_discharge(double[::1] t, double V, double tau, double R,
+                        double[::1] vout, double[::1] iout) noexcept nogil:
+    """Fill vout/iout with the discharging voltage and current at times t"""
+    cdef Py_ssize_t i
+    cdef double e
+    cdef double i0 = -V / R
+    for i in range(t.shape[0]):
+        e = exp(-t[i] / tau)
+        vout[i] = V * e
+        iout[i] = i0 * e